@@ -50,7 +50,7 @@ from albert.collections.substance import SubstanceCollection
 from albert.collections.substance_v4 import SubstanceV4Collection
 from albert.collections.synthesis import SynthesisCollection
 from albert.collections.tags import TagCollection
-from albert.collections.targets import TargetCollection
+from albert.collections.targets import AsyncTargetCollection, TargetCollection
 from albert.collections.tasks import TaskCollection
 from albert.collections.teams import TeamCollection
 from albert.collections.un_numbers import UnNumberCollection
@@ -396,7 +396,7 @@ class Albert:
 
 class AsyncAlbert:
     """
-    Async client for interacting with the Albert chat API (🧪 Beta).
+    Async client for interacting with the Albert chat and target APIs (🧪 Beta).
 
     !!! warning "Beta Feature!"
         Please do not use in production or without explicit guidance from Albert. You might otherwise have a bad experience.
@@ -433,6 +433,8 @@ class AsyncAlbert:
         Access to chat folder API methods.
     chat_flags : ChatFlagCollection
         Access to chat flag API methods.
+    targets : AsyncTargetCollection
+        Access to target API methods.
 
     Examples
     --------
@@ -551,6 +553,10 @@ class AsyncAlbert:
     def chat_flags(self) -> ChatFlagCollection:
         return ChatFlagCollection(session=self.session)
 
+    @property
+    def targets(self) -> AsyncTargetCollection:
+        return AsyncTargetCollection(session=self.session)
+
     async def aclose(self) -> None:
         """Close the underlying HTTP client."""
         await self.session.aclose()
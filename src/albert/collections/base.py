@@ -4,6 +4,7 @@ from albert.core.session import AlbertSession
 from albert.core.shared.models.base import BaseResource, EntityLink
 from albert.core.shared.models.patch import PatchDatum, PatchOperation, PatchPayload
 from albert.core.shared.types import MetadataItem
+from albert.core.utils import field_aliases
 
 
 class BaseCollection:
@@ -199,12 +200,7 @@ class BaseCollection:
                 )
             else:
                 # Get the serialization alias name for the attribute, if it exists
-                field_info = existing.__class__.model_fields[attribute]
-                alias = (
-                    getattr(field_info, "serialization_alias", None)
-                    or field_info.alias
-                    or attribute
-                )
+                alias = field_aliases(type(existing))[attribute]
 
                 if old_value is None and new_value is not None:
                     # Add new attribute
@@ -1,5 +1,4 @@
 from collections.abc import Iterator
-from itertools import islice
 from typing import Any
 
 from pydantic import Field, validate_call
@@ -16,7 +15,7 @@ from albert.core.shared.models.patch import (
     PGPatchDatum,
     PGPatchPayload,
 )
-from albert.core.utils import ensure_list
+from albert.core.utils import batched, ensure_list
 from albert.exceptions import AlbertHTTPError
 from albert.resources.data_templates import (
     CurveExample,
@@ -796,10 +795,9 @@ class DataTemplateCollection(BaseCollection):
         )
 
         def _hydrated() -> Iterator[DataTemplate]:
-            it = (item.id for item in source)
-            while batch := list(islice(it, 100)):
+            for batch in batched((item.id for item in source), 100):
                 try:
-                    yield from self.get_by_ids(ids=batch)
+                    yield from self.get_by_ids(ids=list(batch))
                 except AlbertHTTPError as e:
                     logger.warning(f"Error hydrating batch {batch}: {e}")
 
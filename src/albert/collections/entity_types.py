@@ -8,6 +8,7 @@ from albert.core.session import AlbertSession
 from albert.core.shared.enums import OrderBy
 from albert.core.shared.identifiers import EntityTypeId
 from albert.core.shared.models.patch import PatchDatum, PatchOperation
+from albert.core.utils import field_aliases
 from albert.resources.entity_types import (
     EntityServiceType,
     EntityType,
@@ -212,6 +213,8 @@ class EntityTypeCollection(BaseCollection):
             existing=current_entity_type, updated=entity_type
         )
         patch.data.extend(special_patches)
+        if not patch.data:
+            return current_entity_type
 
         self.session.patch(
             f"{self.base_path}/{entity_type.id}",
@@ -285,8 +288,8 @@ class EntityTypeCollection(BaseCollection):
 
         # Handle standard field visibility updates
         if updated.standard_field_visibility is not None:
-            field_info = EntityTypeStandardFieldVisibility.model_fields
-            for field_name, field in field_info.items():
+            aliases = field_aliases(EntityTypeStandardFieldVisibility)
+            for field_name, attr_name in aliases.items():
                 new_value = getattr(updated.standard_field_visibility, field_name)
                 old_value = (
                     getattr(existing.standard_field_visibility, field_name)
@@ -294,8 +297,6 @@ class EntityTypeCollection(BaseCollection):
                     else None
                 )
                 if new_value != old_value:
-                    # Use the field's alias if available, otherwise use the field name
-                    attr_name = field.alias or field_name
                     patches.append(
                         _nested_field_patch(
                             f"standardFieldVisibility.{attr_name}", old_value, new_value
@@ -303,8 +304,8 @@ class EntityTypeCollection(BaseCollection):
                     )
 
         if updated.standard_field_required is not None:
-            field_info = EntityTypeStandardFieldRequired.model_fields
-            for field_name, field in field_info.items():
+            aliases = field_aliases(EntityTypeStandardFieldRequired)
+            for field_name, attr_name in aliases.items():
                 new_value = getattr(updated.standard_field_required, field_name)
                 old_value = (
                     getattr(existing.standard_field_required, field_name)
@@ -312,7 +313,6 @@ class EntityTypeCollection(BaseCollection):
                     else None
                 )
                 if new_value != old_value:
-                    attr_name = field.alias or field_name
                     patches.append(
                         _nested_field_patch(
                             f"standardFieldRequired.{attr_name}", old_value, new_value
@@ -321,8 +321,8 @@ class EntityTypeCollection(BaseCollection):
 
         # Handle search query string updates
         if updated.search_query_string is not None:
-            field_info = EntityTypeSearchQueryStrings.model_fields
-            for field_name, field in field_info.items():
+            aliases = field_aliases(EntityTypeSearchQueryStrings)
+            for field_name, attr_name in aliases.items():
                 new_value = getattr(updated.search_query_string, field_name)
                 old_value = (
                     getattr(existing.search_query_string, field_name)
@@ -330,8 +330,6 @@ class EntityTypeCollection(BaseCollection):
                     else None
                 )
                 if new_value != old_value:
-                    # Use the field's alias if available, otherwise use the field name
-                    attr_name = field.alias or field_name
                     patches.append(
                         _nested_field_patch(f"searchQueryString.{attr_name}", old_value, new_value)
                     )
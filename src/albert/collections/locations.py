@@ -188,6 +188,8 @@ class LocationCollection(BaseCollection):
             updated=location,
             stringify_values=True,
         )
+        if not patch_payload.data:
+            return current_object
         url = f"{self.base_path}/{location.id}"
         self.session.patch(url, json=patch_payload.model_dump(mode="json", by_alias=True))
         return self.get_by_id(id=location.id)
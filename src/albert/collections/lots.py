@@ -1,11 +1,11 @@
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Literal
 
-from pydantic import validate_call
+from pydantic import TypeAdapter, validate_call
 
 from albert.collections.base import BaseCollection
-from albert.collections.users import UserCollection
 from albert.core.logging import logger
 from albert.core.pagination import AlbertPaginator
 from albert.core.session import AlbertSession
@@ -18,13 +18,17 @@ from albert.core.shared.identifiers import (
     UserId,
 )
 from albert.core.shared.models.patch import PatchDatum, PatchOperation, PatchPayload
-from albert.core.utils import ensure_list
+from albert.core.utils import batched, ensure_list
+from albert.exceptions import AlbertHTTPError
 from albert.resources.inventory import InventoryCategory
 from albert.resources.lots import Lot, LotAdjustmentAction, LotSearchItem
 
 # 14 decimal places for inventory on hand delta calculations
 DECIMAL_DELTA_QUANTIZE = Decimal("0.00000000000000")
 
+# Validate a whole page of lots in a single pydantic-core call
+_LOT_LIST_ADAPTER = TypeAdapter(list[Lot])
+
 
 class LotCollection(BaseCollection):
     """Manage Lots in the Albert platform.
@@ -85,6 +89,8 @@ class LotCollection(BaseCollection):
         Update an existing lot.
     delete(id) -> None
         Delete a lot by its ID.
+    delete_many(ids) -> None
+        Delete many lots by their IDs.
     """
 
     _api_version = "v3"
@@ -171,8 +177,10 @@ class LotCollection(BaseCollection):
         parents but are not yet checked in the SDK. See field docstrings on
         [`Lot`][albert.resources.lots.Lot] for the full create matrix.
 
-        If the API reports a partial success (some lots failed to create), a
-        warning is logged and only the successfully created lots are returned.
+        Large inputs are sent in batches of 100 lots. If the API reports a
+        partial success (some lots failed to create), or a batch request fails
+        while others succeed, a warning is logged and only the successfully
+        created lots are returned. If no lot could be created, the error is raised.
         """
         for lot in lots:
             if lot.task_id is None:
@@ -184,20 +192,49 @@ class LotCollection(BaseCollection):
                 if lot.location is None:
                     raise ValueError("location is required when creating a task lot.")
 
-        payload = [lot.model_dump(by_alias=True, exclude_none=True, mode="json") for lot in lots]
-        response = self.session.post(self.base_path, json=payload)
-        data = response.json()
+        def _create(batch: list[Lot]) -> tuple[list[dict], list]:
+            # Serialize the whole batch in pydantic-core rather than dumping each lot
+            # to a dict and re-encoding it with the stdlib json module.
+            payload = _LOT_LIST_ADAPTER.dump_json(batch, by_alias=True, exclude_none=True)
+            response = self.session.post(self.base_path, data=payload)
+            data = response.json()
+            if isinstance(data, list):
+                return data, []
+            created = data.get("CreatedLots") or data.get("CreatedItems") or []
+            return created, data.get("FailedItems") or []
+
+        def _create_batch(batch: list[Lot]) -> tuple[list[dict], list, AlbertHTTPError | None]:
+            # A failed batch must not hide the lots other batches already created.
+            try:
+                return (*_create(batch), None)
+            except AlbertHTTPError as e:
+                failed = [
+                    {
+                        **lot.model_dump(by_alias=True, exclude_none=True, mode="json"),
+                        "error": str(e),
+                    }
+                    for lot in batch
+                ]
+                return [], failed, e
 
-        if isinstance(data, list):
-            created_raw, failed = data, []
+        batches = [lots[i : i + 100] for i in range(0, len(lots), 100)]
+        if len(batches) <= 1:
+            results = [_create(lots)]
         else:
-            created_raw = data.get("CreatedLots") or data.get("CreatedItems") or []
-            failed = data.get("FailedItems") or []
-
-        if (response.status_code == 206 or failed) and failed:
+            # Bound the request size and post the batches concurrently.
+            with ThreadPoolExecutor(max_workers=min(len(batches), 4)) as executor:
+                batch_results = list(executor.map(_create_batch, batches))
+            errors = [error for _, _, error in batch_results if error is not None]
+            if errors and not any(created for created, _, _ in batch_results):
+                raise errors[0]
+            results = [(created, failed) for created, failed, _ in batch_results]
+
+        created_raw = [item for created, _ in results for item in created]
+        failed = [item for _, batch_failed in results for item in batch_failed]
+        if failed:
             logger.warning("Partial success creating lots", extra={"failed": failed})
 
-        return [Lot(**lot) for lot in created_raw]
+        return _LOT_LIST_ADAPTER.validate_python(created_raw)
 
     @validate_call
     def get_by_id(self, *, id: LotId) -> Lot:
@@ -227,14 +264,15 @@ class LotCollection(BaseCollection):
         """
         url = f"{self.base_path}/{id}"
         response = self.session.get(url)
-        return Lot(**response.json())
+        return Lot.model_validate_json(response.content)
 
     @validate_call
     def get_by_ids(self, *, ids: list[LotId]) -> list[Lot]:
         """Get many fully populated lots by their IDs.
 
         Use this instead of repeated [`get_by_id`][albert.collections.lots.LotCollection.get_by_id] calls when you already
-        have several Lot IDs to fetch.
+        have several Lot IDs to fetch. Requests are automatically split into
+        batches, so arbitrarily long ID lists are supported.
 
         !!! example
             ```python
@@ -254,8 +292,17 @@ class LotCollection(BaseCollection):
             The lots matching the provided IDs.
         """
         url = f"{self.base_path}/ids"
-        response = self.session.get(url, params={"id": ids})
-        return [Lot(**lot) for lot in response.json()["Items"]]
+
+        def _fetch(batch: list[LotId]) -> list[Lot]:
+            response = self.session.get(url, params={"id": batch})
+            return _LOT_LIST_ADAPTER.validate_python(response.json()["Items"])
+
+        batches = [ids[i : i + 100] for i in range(0, len(ids), 100)]
+        if len(batches) <= 1:
+            return _fetch(ids)
+        # Batches are independent, so fetch them concurrently over the shared session.
+        with ThreadPoolExecutor(max_workers=min(len(batches), 8)) as executor:
+            return [lot for page in executor.map(_fetch, batches) for lot in page]
 
     @validate_call
     def delete(self, *, id: LotId) -> None:
@@ -280,6 +327,34 @@ class LotCollection(BaseCollection):
         url = f"{self.base_path}?id={id}"
         self.session.delete(url)
 
+    @validate_call
+    def delete_many(self, *, ids: list[LotId]) -> None:
+        """Delete many lots by their IDs.
+
+        Use this instead of repeated [`delete`][albert.collections.lots.LotCollection.delete] calls when you already
+        have several Lot IDs to remove. Requests are automatically split into
+        batches, so arbitrarily long ID lists are supported.
+
+        !!! example
+            ```python
+            from albert import Albert
+            client = Albert()
+            client.lots.delete_many(ids=["LOTA1", "LOTA2"])
+            ```
+
+        Parameters
+        ----------
+        ids : list[LotId]
+            The Lot IDs to delete (format ``LOT...``).
+
+        Returns
+        -------
+        None
+        """
+        # One request per batch of comma-joined IDs keeps the query string bounded.
+        for batch in batched(ids, 100):
+            self.session.delete(self.base_path, params={"id": ",".join(batch)})
+
     @validate_call
     def search(
         self,
@@ -365,17 +440,22 @@ class LotCollection(BaseCollection):
             "text": search_text,
             "sortBy": sort_by,
             "isDropDown": is_drop_down,
-            "inventoryId": ensure_list(inventory_id),
-            "locationId": ensure_list(location_id),
-            "storageLocationId": ensure_list(storage_location_id),
-            "taskId": ensure_list(task_id),
-            "category": ensure_list(category),
-            "externalBarcodeId": ensure_list(external_barcode_id),
-            "searchField": ensure_list(search_field),
-            "sourceField": ensure_list(source_field),
-            "additionalField": ensure_list(additional_field),
         }
-        params = {key: value for key, value in params.items() if value is not None}
+        list_filters = {
+            "inventoryId": inventory_id,
+            "locationId": location_id,
+            "storageLocationId": storage_location_id,
+            "taskId": task_id,
+            "category": category,
+            "externalBarcodeId": external_barcode_id,
+            "searchField": search_field,
+            "sourceField": source_field,
+            "additionalField": additional_field,
+        }
+        # Only normalize the filters the caller actually set.
+        params.update(
+            (key, ensure_list(value)) for key, value in list_filters.items() if value is not None
+        )
 
         return AlbertPaginator(
             mode=PaginationMode.OFFSET,
@@ -383,9 +463,9 @@ class LotCollection(BaseCollection):
             session=self.session,
             params=params,
             max_items=max_items,
-            deserialize=lambda items: [
-                LotSearchItem(**item)._bind_collection(self) for item in items
-            ],
+            item_type=LotSearchItem,
+            prefetch=True,
+            deserialize=lambda items: [item._bind_collection(self) for item in items],
         )
 
     @validate_call
@@ -470,7 +550,9 @@ class LotCollection(BaseCollection):
             session=self.session,
             params=params,
             max_items=max_items,
-            deserialize=lambda items: [Lot(**item) for item in items],
+            item_type=Lot,
+            prefetch=True,
+            deserialize=lambda items: items,
         )
 
     def _generate_lots_patch_payload(self, *, existing: Lot, updated: Lot) -> PatchPayload:
@@ -479,59 +561,58 @@ class LotCollection(BaseCollection):
             existing=existing, updated=updated, generate_metadata_diff=True
         )
         # inventory on hand is a special case, where the API expects a delta
-        if (
+        inventory_changed = (
             updated.inventory_on_hand is not None
             and updated.inventory_on_hand != existing.inventory_on_hand
-        ):
-            patch_data.data = [d for d in patch_data.data if d.attribute != "inventoryOnHand"]
-            delta = Decimal(str(updated.inventory_on_hand)) - Decimal(
-                str(existing.inventory_on_hand)
-            )
-            delta = delta.quantize(DECIMAL_DELTA_QUANTIZE)  # 14 decimal places
-            patch_data.data.append(
-                PatchDatum(
-                    attribute="inventoryOnHand",
-                    operation=PatchOperation.UPDATE,
-                    new_value=format(delta, "f"),
-                    old_value=str(existing.inventory_on_hand),
-                )
-            )
+        )
 
-        # Handle StorageLocation field name differences
-        # API expects only the ID for the new and old values
+        data = []
         for datum in patch_data.data:
+            if datum.attribute == "inventoryOnHand" and inventory_changed:
+                continue
             if datum.attribute == "StorageLocation":
+                # API expects only the ID for the new and old values
                 datum.attribute = "storageLocation"
                 datum.new_value = datum.new_value.id if datum.new_value else None
                 datum.old_value = datum.old_value.id if datum.old_value else None
-
-        # Owner is a list of users, but the API expects a single user ID string
-        for datum in patch_data.data:
-            if datum.attribute == "Owner":
+            elif datum.attribute == "Owner":
+                # Owner is a list of users, but the API expects a single user ID string
                 if datum.new_value and len(datum.new_value) > 1:
                     raise ValueError("A lot can only have one owner.")
                 datum.new_value = datum.new_value[0].id if datum.new_value else None
                 datum.old_value = datum.old_value[0].id if datum.old_value else None
+                # Drop no-op owner updates where old and new values are identical
+                if datum.old_value == datum.new_value:
+                    continue
+            elif (
+                datum.attribute in {"workflowId", "WorkflowId"}
+                and datum.operation == PatchOperation.ADD
+            ):
+                # workflowId only supports UPDATE (set-once); the base diff emits ADD when unset.
+                datum = PatchDatum(
+                    operation=PatchOperation.UPDATE,
+                    attribute="workflowId",
+                    new_value=datum.new_value,
+                )
+            data.append(datum)
 
-        # Drop no-op owner updates where old and new values are identical after ID extraction
-        patch_data.data = [
-            d
-            for d in patch_data.data
-            if not (d.attribute == "Owner" and d.old_value == d.new_value)
-        ]
-
-        # workflowId only supports UPDATE (set-once); the base diff emits ADD when unset.
-        patch_data.data = [
-            PatchDatum(
-                operation=PatchOperation.UPDATE,
-                attribute="workflowId",
-                new_value=d.new_value,
+        if inventory_changed:
+            delta = Decimal(str(updated.inventory_on_hand)) - Decimal(
+                str(existing.inventory_on_hand)
             )
-            if d.attribute in {"workflowId", "WorkflowId"} and d.operation == PatchOperation.ADD
-            else d
-            for d in patch_data.data
-        ]
+            delta = delta.quantize(DECIMAL_DELTA_QUANTIZE)
+            # Float noise below the API's precision is not a real change.
+            if delta:
+                data.append(
+                    PatchDatum(
+                        attribute="inventoryOnHand",
+                        operation=PatchOperation.UPDATE,
+                        new_value=format(delta, "f"),
+                        old_value=str(existing.inventory_on_hand),
+                    )
+                )
 
+        patch_data.data = data
         return patch_data
 
     @staticmethod
@@ -620,22 +701,24 @@ class LotCollection(BaseCollection):
         else:
             delta = -current
 
-        if delta != 0:
-            patch_payload = PatchPayload(
-                data=[
-                    PatchDatum(
-                        operation=PatchOperation.UPDATE,
-                        attribute="inventoryOnHand",
-                        old_value=str(existing_lot.inventory_on_hand),
-                        new_value=self._format_inventory_delta(delta),
-                    )
-                ]
-            )
-            payload = patch_payload.model_dump(mode="json", by_alias=True)
-            if description is not None:
-                payload["notes"] = description
+        if delta == 0:
+            return existing_lot
 
-            self.session.patch(f"{self.base_path}/{lot_id}", json=payload)
+        patch_payload = PatchPayload(
+            data=[
+                PatchDatum(
+                    operation=PatchOperation.UPDATE,
+                    attribute="inventoryOnHand",
+                    old_value=str(existing_lot.inventory_on_hand),
+                    new_value=self._format_inventory_delta(delta),
+                )
+            ]
+        )
+        payload = patch_payload.model_dump(mode="json", by_alias=True)
+        if description is not None:
+            payload["notes"] = description
+
+        self.session.patch(f"{self.base_path}/{lot_id}", json=payload)
         return self.get_by_id(id=lot_id)
 
     @validate_call
@@ -699,21 +782,22 @@ class LotCollection(BaseCollection):
             current_location_id = (
                 source_lot.storage_location.id if source_lot.storage_location else None
             )
-            if current_location_id != storage_location_id:
-                patch_payload = PatchPayload(
-                    data=[
-                        PatchDatum(
-                            operation=PatchOperation.UPDATE,
-                            attribute="storageLocation",
-                            old_value=current_location_id,
-                            new_value=storage_location_id,
-                        )
-                    ]
-                )
-                self.session.patch(
-                    f"{self.base_path}/{lot_id}",
-                    json=patch_payload.model_dump(mode="json", by_alias=True),
-                )
+            if current_location_id == storage_location_id:
+                return source_lot
+            patch_payload = PatchPayload(
+                data=[
+                    PatchDatum(
+                        operation=PatchOperation.UPDATE,
+                        attribute="storageLocation",
+                        old_value=current_location_id,
+                        new_value=storage_location_id,
+                    )
+                ]
+            )
+            self.session.patch(
+                f"{self.base_path}/{lot_id}",
+                data=patch_payload.model_dump_json(by_alias=True, exclude_unset=True),
+            )
             return self.get_by_id(id=lot_id)
 
         transfer_quantity = quantity
@@ -721,10 +805,7 @@ class LotCollection(BaseCollection):
             raise ValueError("quantity must be greater than zero for transfer.")
 
         if owner is None:
-            current_user = UserCollection(session=self.session).get_current_user()
-            owner = current_user.id
-            if owner is None:
-                raise ValueError("Current user lookup failed to return a valid user id.")
+            owner = self.session.current_user_id
 
         payload = {
             "action": "splitted",
@@ -733,7 +814,7 @@ class LotCollection(BaseCollection):
             "Owner": [{"id": owner}],
         }
         response = self.session.post(f"{self.base_path}/{lot_id}/split", json=payload)
-        return Lot(**response.json())
+        return Lot.model_validate_json(response.content)
 
     def update(self, *, lot: Lot) -> Lot:
         """Update an existing lot.
@@ -774,8 +855,9 @@ class LotCollection(BaseCollection):
         """
         existing_lot = self.get_by_id(id=lot.id)
         patch_data = self._generate_lots_patch_payload(existing=existing_lot, updated=lot)
+        if not patch_data.data:
+            return existing_lot
         url = f"{self.base_path}/{lot.id}"
-        if patch_data.data:
-            self.session.patch(url, json=patch_data.model_dump(mode="json", by_alias=True))
+        self.session.patch(url, data=patch_data.model_dump_json(by_alias=True, exclude_unset=True))
 
         return self.get_by_id(id=lot.id)
@@ -264,12 +264,8 @@ class ParameterCollection(BaseCollection):
             return False
         else:
             metadata_field = metadata_field.split(".")[1]
-        if existing_object.metadata is None:
-            existing_object.metadata = {}
-        if updated_object.metadata is None:
-            updated_object.metadata = {}
-        existing = existing_object.metadata.get(metadata_field, None)
-        updated = updated_object.metadata.get(metadata_field, None)
+        existing = (existing_object.metadata or {}).get(metadata_field)
+        updated = (updated_object.metadata or {}).get(metadata_field)
         return isinstance(existing, list) or isinstance(updated, list)
 
     def update(self, *, parameter: Parameter) -> Parameter:
@@ -118,7 +118,7 @@ class ReportCollection(BaseCollection):
             params[f"inputData[{key}]"] = value
 
         response = self.session.get(path, params=params)
-        return ReportInfo(**response.json())
+        return ReportInfo.model_validate_json(response.content)
 
     def get_analytics_report(
         self,
@@ -225,7 +225,7 @@ class ReportCollection(BaseCollection):
         params = {"viewReport": "1"}
 
         response = self.session.get(path, params=params)
-        return FullAnalyticalReport(**response.json())
+        return FullAnalyticalReport.model_validate_json(response.content)
 
     def create_report(self, *, report: FullAnalyticalReport) -> FullAnalyticalReport:
         """Create a new analytical report.
@@ -264,7 +264,7 @@ class ReportCollection(BaseCollection):
         )
 
         response = self.session.post(path, json=report_data)
-        return FullAnalyticalReport(**response.json())
+        return FullAnalyticalReport.model_validate_json(response.content)
 
     @validate_call
     def delete(self, *, id: ReportId) -> None:
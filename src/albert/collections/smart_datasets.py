@@ -8,6 +8,7 @@ from albert.core.session import AlbertSession
 from albert.core.shared.enums import PaginationMode
 from albert.core.shared.identifiers import ProjectId, SmartDatasetId
 from albert.core.shared.models.patch import PatchDatum, PatchOperation, PatchPayload
+from albert.core.utils import field_aliases
 from albert.resources.smart_datasets import (
     SmartDataset,
     SmartDatasetAggregateBy,
@@ -284,10 +285,7 @@ class SmartDatasetCollection(BaseCollection):
             new_value = getattr(updated, attribute, None)
 
             # Get the serialization alias name for the attribute, if it exists
-            field_info = existing.__class__.model_fields[attribute]
-            alias = (
-                getattr(field_info, "serialization_alias", None) or field_info.alias or attribute
-            )
+            alias = field_aliases(type(existing))[attribute]
 
             if new_value != old_value:
                 # Update existing attribute
@@ -101,14 +101,21 @@ class SubstanceCollection(BaseCollection):
         list[SubstanceInfo]
             The substances found for the given CAS numbers.
         """
+        return self._get_substances(
+            cas_ids=",".join(cas_ids), region=region, catch_errors=catch_errors
+        )
+
+    def _get_substances(
+        self, *, cas_ids: str, region: str, catch_errors: bool | None
+    ) -> list[SubstanceInfo]:
+        """Get the substances for a comma-separated string of CAS numbers."""
         params = {
-            "casIDs": ",".join(cas_ids),
+            "casIDs": cas_ids,
             "region": region,
             "catchErrors": json.dumps(catch_errors) if catch_errors is not None else None,
         }
-        params = {k: v for k, v in params.items() if v is not None}
         response = self.session.get(self.base_path, params=params)
-        return SubstanceResponse.model_validate(response.json()).substances
+        return SubstanceResponse.model_validate_json(response.content).substances
 
     def get_by_id(
         self,
@@ -147,5 +154,5 @@ class SubstanceCollection(BaseCollection):
         SubstanceInfo or None
             The fully populated substance, or None if it is not found.
         """
-        results = self.get_by_ids(cas_ids=[cas_id], region=region, catch_errors=catch_errors)
+        results = self._get_substances(cas_ids=cas_id, region=region, catch_errors=catch_errors)
         return results[0] if results else None
@@ -1,10 +1,26 @@
-from pydantic import validate_call
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import TypeAdapter, validate_call
 
 from albert.collections.base import BaseCollection
+from albert.core.async_session import AsyncAlbertSession
+from albert.core.logging import logger
 from albert.core.session import AlbertSession
 from albert.core.shared.identifiers import ProjectId, TargetId
+from albert.exceptions import AlbertHTTPError
 from albert.resources.targets import Target
 
+_TARGET_LIST_ADAPTER = TypeAdapter(list[Target])
+
+
+def _created_targets(results: list[Target | AlbertHTTPError]) -> list[Target]:
+    """Keep the created targets, raising the first error if every create failed."""
+    created = [result for result in results if isinstance(result, Target)]
+    if results and not created:
+        raise results[0]
+    return created
+
 
 class TargetCollection(BaseCollection):
     """Manage Targets in the Albert platform (🧪 Beta).
@@ -46,12 +62,16 @@ class TargetCollection(BaseCollection):
     -------
     create(target) -> Target
         Create a new target.
+    create_many(targets) -> list[Target]
+        Create several targets concurrently.
     get_by_id(id, parent_id=None) -> Target
         Get a single target by its ID.
     get_by_ids(ids) -> list[Target]
         Get many targets by their IDs.
     delete(id) -> None
         Delete a target by its ID.
+    delete_many(ids) -> None
+        Delete several targets concurrently.
     """
 
     _api_version = "v3"
@@ -101,10 +121,51 @@ class TargetCollection(BaseCollection):
             The newly created target, including its assigned Target ID.
         """
         response = self.session.post(
-            self.base_path,
-            json=target.model_dump(by_alias=True, exclude_none=True, mode="json"),
+            self.base_path, data=target.model_dump_json(by_alias=True, exclude_none=True)
         )
-        return Target(**response.json())
+        return Target.model_validate_json(response.content)
+
+    def create_many(self, *, targets: list[Target]) -> list[Target]:
+        """Create several targets concurrently.
+
+        The targets API has no bulk endpoint, so each target is created with its
+        own request; the requests run in parallel over the shared session.
+
+        !!! example
+            ```python
+            created = client.targets.create_many(targets=[target_a, target_b])
+            ```
+
+        Parameters
+        ----------
+        targets : list[Target]
+            The targets to create.
+
+        Returns
+        -------
+        list[Target]
+            The created targets, in the same order as ``targets``.
+
+        Notes
+        -----
+        If some targets fail to create, a warning is logged for each failure and only
+        the successfully created targets are returned. If none could be created, the
+        first error is raised.
+        """
+        if len(targets) <= 1:
+            return [self.create(target=target) for target in targets]
+
+        def _create(target: Target) -> Target | AlbertHTTPError:
+            # A failed request must not hide the targets other requests already created.
+            try:
+                return self.create(target=target)
+            except AlbertHTTPError as e:
+                logger.warning(f"Error creating target '{target.name}': {e}")
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(len(targets), 8)) as executor:
+            results = list(executor.map(_create, targets))
+        return _created_targets(results)
 
     @validate_call
     def get_by_id(self, *, id: TargetId, parent_id: ProjectId | None = None) -> Target:
@@ -132,11 +193,14 @@ class TargetCollection(BaseCollection):
         url = f"{self.base_path}/{id}"
         params = {"parentId": parent_id} if parent_id is not None else None
         response = self.session.get(url, params=params)
-        return Target(**response.json())
+        return Target.model_validate_json(response.content)
 
     def get_by_ids(self, *, ids: list[TargetId]) -> list[Target]:
         """Get many targets by their IDs.
 
+        Requests are automatically split into batches of 100 IDs, so arbitrarily
+        long ID lists are supported.
+
         !!! example
             ```python
             targets = client.targets.get_by_ids(ids=["TAR1", "TAR2"])
@@ -152,10 +216,20 @@ class TargetCollection(BaseCollection):
         list[Target]
             The matching targets. Targets not found are omitted.
         """
+        if not ids:
+            return []
         url = f"{self.base_path}/ids"
-        response = self.session.get(url, params={"id": ids})
-        data = response.json()
-        return [Target(**item) for item in data.get("Items", [])]
+
+        def _fetch(batch: list[TargetId]) -> list[Target]:
+            response = self.session.get(url, params={"id": batch})
+            return _TARGET_LIST_ADAPTER.validate_python(response.json().get("Items", []))
+
+        batches = [ids[i : i + 100] for i in range(0, len(ids), 100)]
+        if len(batches) <= 1:
+            return _fetch(ids)
+        # Batches are independent, so fetch them concurrently over the shared session.
+        with ThreadPoolExecutor(max_workers=min(len(batches), 8)) as executor:
+            return [target for page in executor.map(_fetch, batches) for target in page]
 
     def delete(self, *, id: TargetId) -> None:
         """Delete a target by its ID.
@@ -176,3 +250,226 @@ class TargetCollection(BaseCollection):
         """
         url = f"{self.base_path}/{id}"
         self.session.delete(url)
+
+    @validate_call
+    def delete_many(self, *, ids: list[TargetId]) -> None:
+        """Delete several targets concurrently.
+
+        Each target is deleted with its own request; the requests run in parallel
+        over the shared session.
+
+        !!! example
+            ```python
+            client.targets.delete_many(ids=["TAR1", "TAR2"])
+            ```
+
+        Parameters
+        ----------
+        ids : list[TargetId]
+            The Target IDs to delete.
+
+        Returns
+        -------
+        None
+        """
+        if len(ids) <= 1:
+            for id in ids:
+                self.delete(id=id)
+            return
+        with ThreadPoolExecutor(max_workers=min(len(ids), 8)) as executor:
+            list(executor.map(lambda id: self.delete(id=id), ids))
+
+
+class AsyncTargetCollection:
+    """Manage Targets in the Albert platform asynchronously (🧪 Beta).
+
+    The async counterpart of
+    [`TargetCollection`][albert.collections.targets.TargetCollection]. Each method
+    is a coroutine, so many independent target requests can be awaited
+    concurrently (e.g. with ``asyncio.gather``) over one shared connection pool.
+
+    This is an async collection accessed as ``client.targets`` on an
+    [`AsyncAlbert`][albert.client.AsyncAlbert] client.
+
+    !!! warning "Beta Feature!"
+        Please do not use in production or without explicit guidance from Albert. You might otherwise have a bad experience.
+        This feature currently falls outside of the Albert support contract, but we'd love your feedback!
+
+    !!! example
+        ```python
+        import asyncio
+        from albert import AsyncAlbert
+
+        async with AsyncAlbert() as client:
+            targets = await asyncio.gather(
+                client.targets.get_by_id(id="TAR1"),
+                client.targets.get_by_id(id="TAR2"),
+            )
+        ```
+
+    Parameters
+    ----------
+    session : AsyncAlbertSession
+        The authenticated Albert async session used for API calls.
+
+    Attributes
+    ----------
+    base_path : str
+        The base API route for target requests.
+
+    Methods
+    -------
+    create(target) -> Target
+        Create a new target.
+    create_many(targets) -> list[Target]
+        Create several targets concurrently.
+    get_by_id(id, parent_id=None) -> Target
+        Get a single target by its ID.
+    get_by_ids(ids) -> list[Target]
+        Get many targets by their IDs.
+    delete(id) -> None
+        Delete a target by its ID.
+    delete_many(ids) -> None
+        Delete several targets concurrently.
+    """
+
+    _api_version = "v3"
+
+    def __init__(self, *, session: AsyncAlbertSession):
+        """Initialize an AsyncTargetCollection.
+
+        Parameters
+        ----------
+        session : AsyncAlbertSession
+            The authenticated Albert async session used for API calls.
+        """
+        self._session = session
+        self.base_path: str = f"/api/{self._api_version}/targets"
+
+    async def create(self, *, target: Target) -> Target:
+        """Create a new target.
+
+        Parameters
+        ----------
+        target : Target
+            The target to create.
+
+        Returns
+        -------
+        Target
+            The newly created target, including its assigned Target ID.
+        """
+        response = await self._session.post(
+            self.base_path, content=target.model_dump_json(by_alias=True, exclude_none=True)
+        )
+        return Target.model_validate_json(response.content)
+
+    async def create_many(self, *, targets: list[Target]) -> list[Target]:
+        """Create several targets concurrently.
+
+        Parameters
+        ----------
+        targets : list[Target]
+            The targets to create.
+
+        Returns
+        -------
+        list[Target]
+            The created targets, in the same order as ``targets``.
+
+        Notes
+        -----
+        If some targets fail to create, a warning is logged for each failure and only
+        the successfully created targets are returned. If none could be created, the
+        first error is raised.
+        """
+
+        async def _create(target: Target) -> Target | AlbertHTTPError:
+            try:
+                return await self.create(target=target)
+            except AlbertHTTPError as e:
+                logger.warning(f"Error creating target '{target.name}': {e}")
+                return e
+
+        results = await asyncio.gather(*(_create(target) for target in targets))
+        return _created_targets(results)
+
+    @validate_call
+    async def get_by_id(self, *, id: TargetId, parent_id: ProjectId | None = None) -> Target:
+        """Get a single target by its ID.
+
+        Parameters
+        ----------
+        id : TargetId
+            The Target ID to retrieve (format ``TAR...``).
+        parent_id : ProjectId, optional
+            The ID of a parent project to inherit the ACL (access control) policy
+            from when the caller does not own the target record.
+
+        Returns
+        -------
+        Target
+            The fully populated target.
+        """
+        params = {"parentId": parent_id} if parent_id is not None else None
+        response = await self._session.get(f"{self.base_path}/{id}", params=params)
+        return Target.model_validate_json(response.content)
+
+    async def get_by_ids(self, *, ids: list[TargetId]) -> list[Target]:
+        """Get many targets by their IDs.
+
+        Requests are split into batches of 100 IDs that are awaited concurrently.
+
+        Parameters
+        ----------
+        ids : list[TargetId]
+            The Target IDs to retrieve.
+
+        Returns
+        -------
+        list[Target]
+            The matching targets. Targets not found are omitted.
+        """
+        if not ids:
+            return []
+        url = f"{self.base_path}/ids"
+
+        async def _fetch(batch: list[TargetId]) -> list[Target]:
+            response = await self._session.get(url, params={"id": batch})
+            return _TARGET_LIST_ADAPTER.validate_python(response.json().get("Items", []))
+
+        batches = [ids[i : i + 100] for i in range(0, len(ids), 100)]
+        if len(batches) <= 1:
+            return await _fetch(ids)
+        pages = await asyncio.gather(*(_fetch(batch) for batch in batches))
+        return [target for page in pages for target in page]
+
+    @validate_call
+    async def delete(self, *, id: TargetId) -> None:
+        """Delete a target by its ID.
+
+        Parameters
+        ----------
+        id : TargetId
+            The Target ID to delete.
+
+        Returns
+        -------
+        None
+        """
+        await self._session.delete(f"{self.base_path}/{id}")
+
+    @validate_call
+    async def delete_many(self, *, ids: list[TargetId]) -> None:
+        """Delete several targets concurrently.
+
+        Parameters
+        ----------
+        ids : list[TargetId]
+            The Target IDs to delete.
+
+        Returns
+        -------
+        None
+        """
+        await asyncio.gather(*(self.delete(id=id) for id in ids))
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from pydantic import validate_call
+from pydantic import TypeAdapter, validate_call
 from requests.exceptions import RetryError
 
 from albert.collections.attachments import AttachmentCollection
@@ -43,6 +44,7 @@ from albert.resources.tasks import (
     TaskHistory,
     TaskPatchPayload,
     TaskSearchItem,
+    TaskUnion,
 )
 from albert.utils.tasks import (
     CSV_EXTENSIONS,
@@ -56,6 +58,9 @@ from albert.utils.tasks import (
     resolve_attachment,
 )
 
+_TASK_LIST_ADAPTER = TypeAdapter(list[TaskUnion])
+_TASK_PATCH_LIST_ADAPTER = TypeAdapter(list[TaskPatchPayload])
+
 
 class TaskCollection(BaseCollection):
     """Manage Tasks in the Albert platform.
@@ -181,11 +186,11 @@ class TaskCollection(BaseCollection):
             The created task (a ``PropertyTask``, ``BatchTask``, or ``GeneralTask``),
             populated with its assigned Task ID.
         """
-        payload = [task.model_dump(mode="json", by_alias=True, exclude_none=True)]
+        payload = _TASK_LIST_ADAPTER.dump_json([task], by_alias=True, exclude_none=True)
         url = f"{self.base_path}/multi?category={task.category.value}"
         if task.parent_id is not None:
             url = f"{url}&parentId={task.parent_id}"
-        response = self.session.post(url=url, json=payload)
+        response = self.session.post(url=url, data=payload)
         task_data = response.json()[0]
         return TaskAdapter.validate_python(task_data)
 
@@ -449,10 +454,29 @@ class TaskCollection(BaseCollection):
         attachment_collection = AttachmentCollection(session=self.session)
         data_template_collection = DataTemplateCollection(session=self.session)
         property_data_collection = PropertyDataCollection(session=self.session)
-        data_template = data_template_collection.get_by_id(id=data_template_id)
 
         needs_task_details = block_id is None or mode is ImportMode.SCRIPT
-        task_details = self.get_by_id(id=task_id) if needs_task_details else None
+        # The data template, task and script attachment lookups are independent,
+        # so overlap them.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            data_template_future = executor.submit(
+                data_template_collection.get_by_id, id=data_template_id
+            )
+            task_future = (
+                executor.submit(self.get_by_id, id=task_id) if needs_task_details else None
+            )
+            script_attachments_future = (
+                executor.submit(
+                    attachment_collection.get_by_parent_ids, parent_ids=[data_template_id]
+                )
+                if mode is ImportMode.SCRIPT
+                else None
+            )
+            data_template = data_template_future.result()
+            task_details = task_future.result() if task_future else None
+            script_attachments = (
+                script_attachments_future.result() if script_attachments_future else None
+            )
 
         if block_id is None:
             block_ids = [
@@ -470,9 +494,6 @@ class TaskCollection(BaseCollection):
 
         script_signed_url: str | None = None
         if mode is ImportMode.SCRIPT:
-            script_attachments = attachment_collection.get_by_parent_ids(
-                parent_ids=[data_template_id]
-            )
             script_entries = (
                 script_attachments.get(data_template_id, []) if script_attachments else []
             )
@@ -656,7 +677,7 @@ class TaskCollection(BaseCollection):
         """
         url = f"{self.base_path}/multi/{id}"
         response = self.session.get(url)
-        return TaskAdapter.validate_python(response.json())
+        return TaskAdapter.validate_json(response.content)
 
     @validate_call
     def search(
@@ -854,7 +875,7 @@ class TaskCollection(BaseCollection):
         Accepts the same filters as [`search`][albert.collections.tasks.TaskCollection.search] but returns complete task
         entities (``PropertyTask``, ``BatchTask``, or ``GeneralTask``) rather than
         lightweight search results. This is slower because it fetches full detail
-        for every match, so prefer [`search`][albert.collections.tasks.TaskCollection.search] when you only need names, IDs, or
+        for every match (up to 8 at a time), so prefer [`search`][albert.collections.tasks.TaskCollection.search] when you only need names, IDs, or
         status. Results are returned as a lazily paginated iterator.
 
         !!! example
@@ -964,6 +985,7 @@ class TaskCollection(BaseCollection):
                 offset=offset,
             ),
             _hydrate,
+            max_workers=8,
         )
 
     def update(self, *, task: BaseTask) -> BaseTask:
@@ -1013,7 +1035,9 @@ class TaskCollection(BaseCollection):
             patch_payload = TaskPatchPayload(data=[datum], id=task.id)
             self.session.patch(
                 url=path,
-                json=[patch_payload.model_dump(mode="json", by_alias=True, exclude_none=True)],
+                data=_TASK_PATCH_LIST_ADAPTER.dump_json(
+                    [patch_payload], by_alias=True, exclude_none=True
+                ),
             )
 
         return self.get_by_id(id=task.id)
@@ -136,7 +136,9 @@ class TeamCollection(BaseCollection):
             session=self.session,
             params=params,
             max_items=max_items,
-            deserialize=lambda items: [Team(**item) for item in items],
+            item_type=Team,
+            prefetch=True,
+            deserialize=lambda items: items,
         )
 
     @validate_call
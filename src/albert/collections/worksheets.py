@@ -69,6 +69,8 @@ class WorksheetCollection(BaseCollection):
         Add a new Sheet built from an existing Sheet template.
     duplicate_sheet(project_id, source_sheet_name, new_sheet_name, ...) -> Worksheet
         Copy an existing Sheet into a new Sheet within the same Project.
+    duplicate_sheets(project_id, source_sheet_name, new_sheet_names, ...) -> Worksheet
+        Copy an existing Sheet into several new Sheets within the same Project.
     create_sheet_template(project_id, source_sheet_name, template_name, ...) -> CustomTemplate
         Save an existing Sheet as a reusable Sheet template.
     """
@@ -299,7 +301,72 @@ class WorksheetCollection(BaseCollection):
         Worksheet
             The Worksheet, now including the newly created Sheet.
         """
+        return self.duplicate_sheets(
+            project_id=project_id,
+            source_sheet_name=source_sheet_name,
+            new_sheet_names=[new_sheet_name],
+            copy_all_pd_rows=copy_all_pd_rows,
+            copy_all_pinned_columns=copy_all_pinned_columns,
+            copy_all_unpinned_columns=copy_all_unpinned_columns,
+            column_names=column_names,
+            task_row_names=task_row_names,
+        )
+
+    @validate_call
+    def duplicate_sheets(
+        self,
+        *,
+        project_id: ProjectId,
+        source_sheet_name: str,
+        new_sheet_names: list[str],
+        copy_all_pd_rows: bool = True,
+        copy_all_pinned_columns: bool = True,
+        copy_all_unpinned_columns: bool = True,
+        column_names: list[str] | None = None,
+        task_row_names: list[str] | None = None,
+    ) -> Worksheet:
+        """Copy an existing Sheet into several new Sheets within the same Project.
+
+        Use this instead of repeated [`duplicate_sheet`][albert.collections.worksheets.WorksheetCollection.duplicate_sheet]
+        calls when making several copies of one Sheet. The Worksheet is fetched and
+        the source Sheet's columns and rows are resolved once, rather than once per
+        copy. The copy options behave as in ``duplicate_sheet`` and apply to every
+        new Sheet.
+
+        !!! example
+            ```python
+            worksheet = client.worksheets.duplicate_sheets(
+                project_id="PRO1",
+                source_sheet_name="Trial 1",
+                new_sheet_names=["Trial 2", "Trial 3"],
+            )
+            ```
+
+        Parameters
+        ----------
+        project_id : ProjectId
+            The ID of the Project the source Sheet belongs to (format ``PRO...``).
+        source_sheet_name : str
+            The name of the existing Sheet to duplicate.
+        new_sheet_names : list[str]
+            The names of the new Sheets to create, in creation order.
+        copy_all_pd_rows : bool, optional
+            When True, all Product Design rows from the source Sheet are copied.
+            Default is True.
+        copy_all_pinned_columns : bool, optional
+            When True, includes all pinned columns from the source Sheet. Default is True.
+        copy_all_unpinned_columns : bool, optional
+            When True, includes all unpinned columns from the source Sheet. Default is True.
+        column_names : list[str], optional
+            Column names to explicitly copy.
+        task_row_names : list[str], optional
+            Names of task rows to include from the source Sheet's Tasks.
 
+        Returns
+        -------
+        Worksheet
+            The Worksheet, now including the newly created Sheets.
+        """
         worksheet = self.get_by_project_id(project_id=project_id)
         sheet = get_sheet_from_worksheet(sheet_name=source_sheet_name, worksheet=worksheet)
         columns = get_columns_to_copy(
@@ -310,19 +377,18 @@ class WorksheetCollection(BaseCollection):
         )
         task_rows = get_task_rows_to_copy(sheet=sheet, input_row_names=task_row_names)
 
-        payload = {
-            "name": new_sheet_name,
-            "sourceData": {
-                "projectId": project_id,
-                "sheetId": sheet.id,
-                "Columns": [{"id": col_id} for col_id in columns],
-                "copyAllPDRows": copy_all_pd_rows,
-                "TaskRows": [{"id": row_id} for row_id in task_rows],
-            },
+        source_data = {
+            "projectId": project_id,
+            "sheetId": sheet.id,
+            "Columns": [{"id": col_id} for col_id in columns],
+            "copyAllPDRows": copy_all_pd_rows,
+            "TaskRows": [{"id": row_id} for row_id in task_rows],
         }
 
         path = f"{self.base_path}/project/{project_id}/sheets"
-        self.session.put(path, json=payload)
+        # Sheets are appended to the same worksheet, so create them one at a time.
+        for new_sheet_name in new_sheet_names:
+            self.session.put(path, json={"name": new_sheet_name, "sourceData": source_data})
         return self.get_by_project_id(project_id=project_id)
 
     @validate_call
@@ -1,7 +1,9 @@
+from collections import deque
 from collections.abc import AsyncIterator, Callable, Iterable, Iterator
-from typing import Any, Literal, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, Literal, TypeVar
 
-from pydantic import ValidationError
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 from albert.core.async_session import AsyncAlbertSession
 from albert.core.logging import logger
@@ -14,6 +16,19 @@ OutType = TypeVar("OutType")
 DEFAULT_LIMIT = 1000
 
 
+class _Page(BaseModel, Generic[ItemType]):
+    """A paginated response body whose items are validated straight from JSON.
+
+    Envelope fields (``total``, ``offset``, ``lastKey``, ...) are kept as extras.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    items: list[ItemType] | None = Field(
+        default=None, validation_alias=AliasChoices("Items", "items")
+    )
+
+
 class AlbertPaginator(Iterator[ItemType]):
     """Helper class for pagination through Albert endpoints.
 
@@ -29,6 +44,10 @@ class AlbertPaginator(Iterator[ItemType]):
 
     A custom `deserialize` function is provided when additional logic is required to load
     the raw items returned by the search listing, e.g., making additional Albert API calls.
+    When `item_type` is given, each page is validated directly from the response bytes
+    (skipping the intermediate dicts) and `deserialize` receives the validated items.
+    With `prefetch`, the request for the next page is issued in the background while the
+    caller consumes the current one.
     The `max_items` argument can be used to stop iteration early, regardless of mode.
 
     After iteration, [`has_more`][albert.core.pagination.AlbertPaginator.has_more] is True
@@ -49,6 +68,8 @@ class AlbertPaginator(Iterator[ItemType]):
         method: Literal["GET", "POST"] = "GET",
         json: dict[str, Any] | None = None,
         max_items: int | None = None,
+        item_type: type | None = None,
+        prefetch: bool = False,
     ):
         """
         Initialize a paginator for Albert endpoints.
@@ -71,12 +92,23 @@ class AlbertPaginator(Iterator[ItemType]):
             JSON body for POST requests.
         max_items : int | None, optional
             Maximum number of items to yield.
+        item_type : type | None, optional
+            Model type of the listed items. When set, pages are validated from the raw
+            response bytes and ``deserialize`` receives instances of this type. Only for
+            responses that list their items under ``Items``/``items``.
+        prefetch : bool, optional
+            Fetch the next page in a background thread while the current page is being
+            consumed (default is False). No lookahead request is made when the current
+            page already reaches ``max_items``.
         """
         self.path = path
         self.mode = mode
         self.session = session
         self.deserialize = deserialize
         self.max_items = max_items
+        self.prefetch = prefetch
+        self._page_model = _Page[item_type] if item_type is not None else None
+        self._item_adapter = TypeAdapter(item_type) if item_type is not None else None
         self.method = method.upper()
         self.params = params or {}
         self.json = json or {}
@@ -135,14 +167,24 @@ class AlbertPaginator(Iterator[ItemType]):
 
     def _create_iterator(self) -> Iterator[ItemType]:
         """Create an iterator that yields paginated items."""
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            yield from self._iterate_pages(executor)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iterate_pages(self, executor: ThreadPoolExecutor | None) -> Iterator[ItemType]:
+        """Yield items page by page, optionally prefetching the next page."""
         yielded = 0
         seen_keys: set[str] = set()
+        pending: Future | None = None
 
         while True:
-            response = self._request()
-            data = response.json()
+            response = pending.result() if pending is not None else self._request()
+            pending = None
+            data, items, validated = self._parse_page(response)
             self._record_total(data)
-            items = self._response_items(data)
             item_count = len(items)
 
             if not items and self.mode == PaginationMode.OFFSET:
@@ -162,20 +204,20 @@ class AlbertPaginator(Iterator[ItemType]):
                     return
                 seen_keys.add(current_key)
 
-            try:
-                deserialized = list(self.deserialize(items))
-            except ValidationError:
-                # Fall back to deserializing one item at a time so a single
-                # unparseable row doesn't discard the rest of the page.
-                deserialized = []
-                for item in items:
-                    try:
-                        deserialized.extend(self.deserialize([item]))
-                    except ValidationError as e:
-                        item_id = item.get("albertId") or item.get("id")
-                        suffix = f" {item_id}" if item_id else ""
-                        logger.warning(f"Skipping unparseable item{suffix}: {e}")
-
+            advanced = None
+            if executor is not None and self._can_prefetch(
+                count=item_count, yielded=yielded, current_key=current_key
+            ):
+                # Pagination state for the next page is known now; request it while the
+                # caller works through this one. ``last_key`` is only recorded once this
+                # page has been fully yielded, so resuming from it never skips items.
+                advanced = self._update_params(data=data, count=item_count, record_key=False)
+                if advanced:
+                    pending = executor.submit(self._request)
+
+            deserialized = (
+                list(self.deserialize(items)) if validated else self._deserialize_items(items)
+            )
             for item in deserialized:
                 if self.max_items is not None and yielded >= self.max_items:
                     # Unyielded item on this page — definitive signal more exist.
@@ -194,13 +236,66 @@ class AlbertPaginator(Iterator[ItemType]):
                     )
                 return
 
+            if advanced is not None and self.mode == PaginationMode.KEY:
+                self._last_key = current_key
+            if pending is not None:
+                continue
             if self.mode == PaginationMode.KEY and current_key is None:
                 return
-            if not self._update_params(data=data, count=item_count):
+            if advanced is None:
+                advanced = self._update_params(data=data, count=item_count)
+            if not advanced:
                 if self._total_implies_more(yielded):
                     self._has_more = True
                 return
 
+    def _can_prefetch(self, *, count: int, yielded: int, current_key: str | None) -> bool:
+        """Return whether another page may be needed after the current one."""
+        if self.max_items is not None and yielded + count >= self.max_items:
+            return False
+        return not (self.mode == PaginationMode.KEY and current_key is None)
+
+    def _parse_page(self, response) -> tuple[dict[str, Any], list, bool]:
+        """Split a response into its envelope and items.
+
+        Returns the envelope fields, the page items, and whether the items were already
+        validated into ``item_type`` from the raw response bytes.
+        """
+        if self._page_model is not None:
+            try:
+                page = self._page_model.model_validate_json(response.content)
+            except ValidationError:
+                # Re-parse below so the bad rows can be skipped individually.
+                pass
+            else:
+                return page.model_extra or {}, page.items or [], True
+
+        data = response.json()
+        return data, self._response_items(data), False
+
+    def _deserialize_items(self, items: list[dict]) -> list[ItemType]:
+        """Deserialize raw items, skipping any that fail validation."""
+
+        def deserialize(raw: list[dict]) -> Iterable[ItemType]:
+            if self._item_adapter is not None:
+                raw = [self._item_adapter.validate_python(item) for item in raw]
+            return self.deserialize(raw)
+
+        try:
+            return list(deserialize(items))
+        except ValidationError:
+            # Fall back to deserializing one item at a time so a single
+            # unparseable row doesn't discard the rest of the page.
+            deserialized = []
+            for item in items:
+                try:
+                    deserialized.extend(deserialize([item]))
+                except ValidationError as e:
+                    item_id = item.get("albertId") or item.get("id")
+                    suffix = f" {item_id}" if item_id else ""
+                    logger.warning(f"Skipping unparseable item{suffix}: {e}")
+            return deserialized
+
     def _next_request_offset(self, *, data: dict[str, Any], count: int) -> int:
         """Compute the offset for the next page request."""
         offset = data.get("offset")
@@ -232,8 +327,12 @@ class AlbertPaginator(Iterator[ItemType]):
             case mode:
                 raise AlbertException(f"Unknown pagination mode {mode}.")
 
-    def _update_params(self, *, data: dict[str, Any], count: int) -> bool:
-        """Update pagination state from a response payload."""
+    def _update_params(self, *, data: dict[str, Any], count: int, record_key: bool = True) -> bool:
+        """Update pagination state from a response payload.
+
+        ``record_key=False`` advances the request parameters without updating
+        ``last_key``, for when the next page is requested before this one is consumed.
+        """
         match self.mode:
             case PaginationMode.OFFSET:
                 if count == 0:
@@ -245,7 +344,8 @@ class AlbertPaginator(Iterator[ItemType]):
                 )
             case PaginationMode.KEY:
                 last_key = data.get("lastKey")
-                self._last_key = last_key
+                if record_key:
+                    self._last_key = last_key
                 if not last_key:
                     return False
                 self._pagination_params["startKey"] = last_key
@@ -333,12 +433,18 @@ class MappedPaginator(MetadataPreservingIterator[OutType]):
     map_fn : Callable[[Any], OutType | None]
         Applied to each source item; returning ``None`` drops that item (e.g. a hit
         that could not be hydrated), without affecting ``has_more`` / ``total``.
+    max_workers : int, optional
+        When greater than 1, ``map_fn`` runs on up to this many source items at once
+        (for I/O-bound hydration). Results keep the source order and at most
+        ``max_workers`` items are read ahead of the caller. Defaults to 1.
     """
 
     def __init__(
         self,
         source: Iterator[Any],
         map_fn: Callable[[Any], OutType | None],
+        *,
+        max_workers: int = 1,
     ):
         def _mapped() -> Iterator[OutType]:
             for item in source:
@@ -346,7 +452,25 @@ class MappedPaginator(MetadataPreservingIterator[OutType]):
                 if mapped is not None:
                     yield mapped
 
-        super().__init__(source, _mapped())
+        def _mapped_concurrently() -> Iterator[OutType]:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            pending: deque[Future[OutType | None]] = deque()
+            try:
+                for item in source:
+                    pending.append(executor.submit(map_fn, item))
+                    if len(pending) < max_workers:
+                        continue
+                    mapped = pending.popleft().result()
+                    if mapped is not None:
+                        yield mapped
+                while pending:
+                    mapped = pending.popleft().result()
+                    if mapped is not None:
+                        yield mapped
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        super().__init__(source, _mapped_concurrently() if max_workers > 1 else _mapped())
 
 
 class AsyncAlbertPaginator(AsyncIterator[ItemType]):
@@ -60,6 +60,9 @@ class AlbertSession(requests.Session):
 
         self._auth_manager = auth_manager
         self._provided_token = token
+        # The authenticated user does not change for the lifetime of a session, so
+        # its ID is looked up at most once (see ``current_user_id``).
+        self._current_user_id: str | None = None
 
         # Set up retry logic
         retries = retries if retries is not None else 3
@@ -71,10 +74,26 @@ class AlbertSession(requests.Session):
             status_forcelist=(500, 502, 503, 504, 403),
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # Collections fan out batch requests over worker threads; size the keep-alive
+        # pool so those connections are reused instead of discarded.
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=20)
         self.mount("http://", adapter)
         self.mount("https://", adapter)
 
+    @property
+    def current_user_id(self) -> str:
+        """The ID of the authenticated user, looked up once and cached for the session."""
+        if self._current_user_id is None:
+            response = self.get(
+                "/api/v3/login/validatejwt",
+                params={"includeUserDetails": True},
+            )
+            user_id = response.json().get("userId")
+            if not user_id:
+                raise ValueError("Current user lookup failed.")
+            self._current_user_id = user_id
+        return self._current_user_id
+
     @property
     def _access_token(self) -> str | None:
         """Get the access token from the token manager or provided token."""
@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import sys
+from collections.abc import Iterable, Iterator
+from functools import cache
+from itertools import islice
 from typing import TypeVar
 
+from pydantic import BaseModel
+
 T = TypeVar("T")
 
+if sys.version_info >= (3, 12):  # pragma: no cover (py312+)
+    from itertools import batched
+else:  # pragma: no cover (py312+)
+
+    def batched(iterable: Iterable[T], n: int) -> Iterator[tuple[T, ...]]:
+        """Yield successive ``n``-sized tuples from ``iterable`` (``itertools.batched`` shim)."""
+        it = iter(iterable)
+        while batch := tuple(islice(it, n)):
+            yield batch
+
 
 def ensure_list(value: T | Iterable[T] | None) -> list[T] | None:
     """Return ``value`` as a list, preserving ``None`` and existing lists."""
@@ -18,3 +33,16 @@ def ensure_list(value: T | Iterable[T] | None) -> list[T] | None:
     if isinstance(value, tuple | set):
         return list(value)
     return [value]
+
+
+@cache
+def field_aliases(model: type[BaseModel]) -> dict[str, str]:
+    """Map each field name of ``model`` to the name it is serialized under.
+
+    Pydantic fields are fixed per class, so the map is built once per model and reused
+    by the patch generators.
+    """
+    return {
+        name: field.serialization_alias or field.alias or name
+        for name, field in model.model_fields.items()
+    }
@@ -1472,7 +1472,9 @@ class Sheet(BaseSessionResource):  # noqa:F811
             f"/api/v3/worksheet/design/{design_obj.id}/rows", json=payload
         )
         self.grid = None
-        data = response.json()[0] if isinstance(response.json(), list) else response.json()
+        data = response.json()
+        if isinstance(data, list):
+            data = data[0]
         return Row(
             rowId=data["rowId"],
             type=data["type"],
@@ -1543,7 +1545,9 @@ class Sheet(BaseSessionResource):  # noqa:F811
             f"/api/v3/worksheet/design/{design_obj.id}/rows", json=[payload]
         )
         self.grid = None
-        data = response.json()[0] if isinstance(response.json(), list) else response.json()
+        data = response.json()
+        if isinstance(data, list):
+            data = data[0]
         return Row(
             rowId=data["rowId"],
             type=data["type"],
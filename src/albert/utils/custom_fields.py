@@ -1,4 +1,5 @@
 from albert.core.shared.models.patch import PatchDatum, PatchOperation, PatchPayload
+from albert.core.utils import field_aliases
 from albert.resources.custom_fields import CustomField
 
 
@@ -16,8 +17,7 @@ def _generate_custom_field_patch_payload(
         elif (old_value == [] or old_value == {}) and new_value is None:
             old_value = None
 
-        field_info = existing.__class__.model_fields[attribute]
-        alias = getattr(field_info, "serialization_alias", None) or field_info.alias or attribute
+        alias = field_aliases(type(existing))[attribute]
 
         if alias == "entityCategory":
             # Backend expects item-level add/delete operations for entityCategory.
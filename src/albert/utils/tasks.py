@@ -23,6 +23,9 @@ from albert.resources.tasks import (
 )
 
 CSV_EXTENSIONS: set[str] = {"csv"}
+# Task attributes diffed by hand in generate_adv_patch_payload; a tuple keeps the
+# order of the generated operations stable across runs.
+_UPDATABLE_ATTRIBUTES_SPECIAL = ("inventory_information", "assigned_to", "tags", "project")
 
 
 def build_property_payload(
@@ -40,25 +43,33 @@ def build_property_payload(
         if column and column.data_column_id
     }
 
+    # Resolve each mapped column once; the per-cell payloads share these references.
+    mapped_columns = [
+        (
+            csv_key,
+            TaskDataColumn(
+                data_column_id=data_column_id,
+                column_sequence=columns_by_id[data_column_id].sequence,
+            ),
+        )
+        for data_column_id, csv_key in column_to_csv_key.items()
+        if data_column_id in columns_by_id
+    ]
+    data_template = EntityLink(id=data_template_id)
+
     properties: list[TaskPropertyCreate] = []
     for trial_index, row in enumerate(data_rows, start=1):
-        for data_column_id, csv_key in column_to_csv_key.items():
+        for csv_key, data_column in mapped_columns:
             value = row.get(csv_key)
             if value is None or value == "":
                 continue
-            column = columns_by_id.get(data_column_id)
-            if column is None:
-                continue
             properties.append(
                 TaskPropertyCreate(
-                    data_column=TaskDataColumn(
-                        data_column_id=data_column_id,
-                        column_sequence=column.sequence,
-                    ),
+                    data_column=data_column,
                     value=str(value),
                     visible_trial_number=trial_index,
                     interval_combination=interval,
-                    data_template=EntityLink(id=data_template_id),
+                    data_template=data_template,
                 )
             )
 
@@ -229,13 +240,8 @@ def is_metadata_item_list(
 
     metadata_field = metadata_field.split(".")[1]
 
-    if existing_object.metadata is None:
-        existing_object.metadata = {}
-    if updated_object.metadata is None:
-        updated_object.metadata = {}
-
-    existing = existing_object.metadata.get(metadata_field, None)
-    updated = updated_object.metadata.get(metadata_field, None)
+    existing = (existing_object.metadata or {}).get(metadata_field)
+    updated = (updated_object.metadata or {}).get(metadata_field)
 
     return isinstance(existing, list) or isinstance(updated, list)
 
@@ -264,12 +270,6 @@ def generate_adv_patch_payload(
 ) -> TaskPatchPayload:
     """Generate a patch payload for updating a task with special-case fields."""
 
-    _updatable_attributes_special = {
-        "inventory_information",
-        "assigned_to",
-        "tags",
-        "project",
-    }
     if updated.assigned_to is not None:
         updated.assigned_to = EntityLinkWithName(
             id=updated.assigned_to.id, name=updated.assigned_to.name
@@ -280,7 +280,7 @@ def generate_adv_patch_payload(
         updated=updated,
     )
 
-    for attribute in _updatable_attributes_special:
+    for attribute in _UPDATABLE_ATTRIBUTES_SPECIAL:
         # Leave special-case fields untouched when the caller never set them,
         # so an omitted field is not coerced to [] and read as a deletion.
         if attribute not in updated.model_fields_set:
@@ -315,9 +315,8 @@ def generate_adv_patch_payload(
                 {
                     "operation": PatchOperation.UPDATE,
                     "attribute": "AssignedTo",
-                    "oldValue": EntityLink(
-                        id=old_value.id
-                    ),  # can't include name with the old value or you get an error
+                    # can't include name with the old value or you get an error
+                    "oldValue": {"id": old_value.id},
                     "newValue": new_value,
                 }
             )
@@ -325,8 +324,8 @@ def generate_adv_patch_payload(
         if attribute == "inventory_information":
             old_value = getattr(existing, attribute) or []
             new_value = getattr(updated, attribute) or []
-            existing_unique = {f"{x.inventory_id}#{x.lot_id}": x for x in old_value}
-            updated_unique = {f"{x.inventory_id}#{x.lot_id}": x for x in new_value}
+            existing_unique = {(x.inventory_id, x.lot_id): x for x in old_value}
+            updated_unique = {(x.inventory_id, x.lot_id): x for x in new_value}
 
             # Find items to remove (in existing but not in updated)
             inv_to_remove = [
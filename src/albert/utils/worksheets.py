@@ -19,27 +19,19 @@ def get_columns_to_copy(
     input_column_names: list[str] | None,
 ) -> list[str]:
     sheet_columns = sheet.columns
-    all_columns = {col.name: col.column_id for col in sheet_columns}
-
-    # If both flags are true, copy everything
-    if copy_all_pinned_columns and copy_all_unpinned_columns:
-        columns_to_copy: set[str] = {col.column_id for col in sheet_columns}
-    else:
-        columns_to_copy = set()
-        # Copy pinned columns
-        if copy_all_pinned_columns:
-            columns_to_copy.update(
-                col.column_id for col in sheet_columns if getattr(col, "pinned", False)
-            )
-
-        # Copy unpinned columns
-        if copy_all_unpinned_columns:
-            columns_to_copy.update(
-                col.column_id for col in sheet_columns if not getattr(col, "pinned", False)
-            )
+
+    # Copy pinned and/or unpinned columns in a single pass over the sheet
+    columns_to_copy: set[str] = {
+        col.column_id
+        for col in sheet_columns
+        if (
+            copy_all_pinned_columns if getattr(col, "pinned", False) else copy_all_unpinned_columns
+        )
+    }
 
     # Add any explicitly specified columns
     if input_column_names:
+        all_columns = {col.name: col.column_id for col in sheet_columns}
         for name in input_column_names:
             if name not in all_columns:
                 raise ValueError(f"Column name {name!r} not found in sheet {sheet.name!r}")
@@ -197,6 +197,31 @@ def test_adjust_validation(client: Albert, seeded_lot: Lot, action, quantity, er
         )
 
 
+def test_delete_many(
+    client: Albert,
+    seeded_inventory,
+    seeded_storage_locations,
+    seeded_locations,
+):
+    """Test deleting several lots in one call."""
+    lots = generate_lot_seeds(
+        seeded_inventory=seeded_inventory,
+        seeded_storage_locations=seeded_storage_locations,
+        seeded_locations=seeded_locations,
+    )[:2]
+    created = client.lots.create(lots=lots)
+    ids = [lot.id for lot in created]
+    try:
+        client.lots.delete_many(ids=ids)
+        for lot_id in ids:
+            with pytest.raises(NotFoundError):
+                client.lots.get_by_id(id=lot_id)
+    finally:
+        for lot_id in ids:
+            with suppress(NotFoundError):
+                client.lots.delete(id=lot_id)
+
+
 def test_transfer_with_explicit_owner(
     client: Albert,
     seeded_lot: Lot,
@@ -1,6 +1,9 @@
+import asyncio
+from contextlib import suppress
+
 import pytest
 
-from albert.client import Albert
+from albert.client import Albert, AsyncAlbert
 from albert.core.shared.enums import Status
 from albert.exceptions import NotFoundError
 from albert.resources.data_templates import DataTemplate
@@ -71,6 +74,40 @@ def test_target_get_by_ids(client: Albert, seeded_targets: list[Target]):
         assert target_id in fetched_ids
 
 
+def test_target_create_many(client: Albert, seed_prefix: str, seeded_targets: list[Target]):
+    """Test creating several targets in one call."""
+    targets = [
+        Target(
+            name=f"{seed_prefix} - Bulk Target {i}",
+            data_template_id=seeded_targets[0].data_template_id,
+            data_column_id=seeded_targets[0].data_column_id,
+            type=TargetType.PERFORMANCE,
+            target_value=Criterion(operator=ComparisonOperator.GTE, value=i),
+            is_required=False,
+        )
+        for i in range(3)
+    ]
+    created_ids: list[str] = []
+    try:
+        created = client.targets.create_many(targets=targets)
+        created_ids.extend(t.id for t in created)
+        assert [t.name for t in created] == [t.name for t in targets]
+        assert all(t.id.startswith("TAR") for t in created)
+    finally:
+        for target_id in created_ids:
+            with suppress(NotFoundError):
+                client.targets.delete(id=target_id)
+
+
+async def test_async_target_get_by_id_concurrent(
+    async_client: AsyncAlbert, seeded_targets: list[Target]
+):
+    """Test fetching several targets concurrently with the async collection."""
+    ids = [t.id for t in seeded_targets[:2]]
+    results = await asyncio.gather(*(async_client.targets.get_by_id(id=i) for i in ids))
+    assert [t.id for t in results] == ids
+
+
 def test_target_delete(client: Albert, seed_prefix: str, seeded_targets: list[Target]):
     """Test creating and deleting a target."""
 
@@ -94,6 +131,35 @@ def test_target_delete(client: Albert, seed_prefix: str, seeded_targets: list[Ta
         client.targets.get_by_id(id=created.id)
 
 
+def test_target_delete_many(client: Albert, seed_prefix: str, seeded_targets: list[Target]):
+    """Test deleting several targets in one call."""
+    created_ids: list[str] = []
+    try:
+        created = client.targets.create_many(
+            targets=[
+                Target(
+                    name=f"{seed_prefix} - Delete Many Target {i}",
+                    data_template_id=seeded_targets[0].data_template_id,
+                    data_column_id=seeded_targets[0].data_column_id,
+                    type=TargetType.PERFORMANCE,
+                    target_value=Criterion(operator=ComparisonOperator.EQ, value=i),
+                    is_required=False,
+                )
+                for i in range(2)
+            ]
+        )
+        created_ids.extend(t.id for t in created)
+        client.targets.delete_many(ids=created_ids)
+
+        for target_id in created_ids:
+            with pytest.raises(NotFoundError):
+                client.targets.get_by_id(id=target_id)
+    finally:
+        for target_id in created_ids:
+            with suppress(NotFoundError):
+                client.targets.delete(id=target_id)
+
+
 class TestTargetParameterCoercion:
     """Test that TargetParameter.value tolerantly coerces legacy bare scalars."""
 
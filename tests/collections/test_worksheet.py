@@ -1,6 +1,10 @@
+from contextlib import suppress
+
 import pytest
 
 from albert import Albert
+from albert.exceptions import AlbertHTTPError
+from albert.resources.sheets import Sheet
 from albert.resources.worksheets import Worksheet
 
 pytestmark = pytest.mark.xdist_group("sheets")
@@ -20,6 +24,34 @@ def test_add_sheet(client: Albert, seeded_worksheet: Worksheet):
     assert len(updated_worksheet.sheets) == existing_number + 1
 
 
+def test_duplicate_sheets(
+    client: Albert, seeded_worksheet: Worksheet, seeded_sheet: Sheet, seed_prefix: str
+):
+    project_id = seeded_worksheet.project_id
+    new_names = [f"test {seed_prefix} copy {i}" for i in range(2)]
+    try:
+        updated_worksheet = client.worksheets.duplicate_sheets(
+            project_id=project_id,
+            source_sheet_name=seeded_sheet.name,
+            new_sheet_names=new_names,
+        )
+        assert isinstance(updated_worksheet, Worksheet)
+        sheet_names = [s.name for s in updated_worksheet.sheets]
+        for name in new_names:
+            assert name in sheet_names
+    finally:
+        # Sheets cannot be deleted; hide any copies that were created, even if the
+        # call failed partway through.
+        worksheet = client.worksheets.get_by_project_id(project_id=project_id)
+        for sheet in worksheet.sheets:
+            if sheet.name in new_names:
+                with suppress(AlbertHTTPError):
+                    client.session.patch(
+                        f"/api/v3/worksheet/sheet/{sheet.id}",
+                        json=[{"attribute": "hidden", "operation": "update", "newValue": True}],
+                    )
+
+
 # Need to seed a Sheet Template First
 # def test_setup_new_sheet_from_template(client: Albert, seeded_worksheet: Worksheet):
 #     existing_number = len(seeded_worksheet.sheets)
@@ -6,6 +6,8 @@ These exercise the pagination state machine with scripted responses so edge case
 
 from __future__ import annotations
 
+import json
+import time
 from typing import Any
 
 from pydantic import BaseModel
@@ -28,6 +30,10 @@ class _JsonResponse:
     def json(self) -> dict[str, Any]:
         return self._data
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._data).encode()
+
 
 class _ScriptedSession:
     """Minimal session that returns a fixed sequence of JSON page payloads."""
@@ -351,6 +357,36 @@ def test_mapped_paginator_drops_none_without_affecting_completeness() -> None:
     assert mapped.total == 10
 
 
+def test_concurrent_mapped_paginator_keeps_source_order() -> None:
+    """Hydrating with several workers yields the same items, in order, as serial mapping."""
+    session = _ScriptedSession(
+        [
+            _page(list(range(20)), offset=0, total=20),
+            _page([], offset=20, total=20),
+        ]
+    )
+
+    source = AlbertPaginator(
+        mode=PaginationMode.OFFSET,
+        path="/api/v3/tasks/search",
+        session=session,
+        deserialize=lambda items: items,
+        params={"order": "desc", "limit": 1000},
+    )
+
+    def _slow_hydrate(item: dict) -> dict | None:
+        # Later items finish first, so ordering must come from the source, not completion.
+        time.sleep((20 - item["id"]) / 2000)
+        return item if item["id"] % 3 else None
+
+    mapped = MappedPaginator(source, _slow_hydrate, max_workers=4)
+    items = list(mapped)
+
+    assert [i["id"] for i in items] == [i for i in range(20) if i % 3]
+    assert mapped.has_more is False
+    assert mapped.total == 20
+
+
 def test_key_mode_has_more_true_when_max_items_hits_full_page_with_last_key() -> None:
     """KEY mode: a full page plus a continuation key at the cap means more exist."""
     session = _ScriptedSession([_page(list(range(10)), last_key="KEY1")])
@@ -547,3 +583,132 @@ def test_paginator_skips_unparseable_item_without_losing_page(caplog) -> None:
 
     assert results == [1, 3]
     assert any("A2" in record.message for record in caplog.records)
+
+
+def test_paginator_validates_typed_pages_from_bytes() -> None:
+    """Typed pages deserialize into models and keep envelope fields for pagination."""
+    session = _ScriptedSession(
+        [
+            {"Items": [{"value": 1}, {"value": 2}], "offset": "0", "total": "3"},
+            {"Items": [{"value": 3}], "offset": "2", "total": "3"},
+            {"Items": [], "offset": "3", "total": "3"},
+        ]
+    )
+
+    paginator = AlbertPaginator(
+        path="/fake",
+        mode=PaginationMode.OFFSET,
+        session=session,
+        item_type=_FakeItem,
+        deserialize=lambda items: [item.value for item in items],
+    )
+
+    assert list(paginator) == [1, 2, 3]
+    assert paginator.total == 3
+    assert session.requests[-1]["params"]["offset"] == 3
+
+
+def test_typed_paginator_skips_unparseable_item_without_losing_page(caplog) -> None:
+    """A typed page with one malformed row falls back to per-item validation."""
+    session = _ScriptedSession(
+        [
+            {
+                "Items": [
+                    {"albertId": "A1", "value": 1},
+                    {"albertId": "A2", "value": "not-a-number"},
+                    {"albertId": "A3", "value": 3},
+                ],
+                "offset": "0",
+            },
+            {"Items": [], "offset": "3"},
+        ]
+    )
+
+    paginator = AlbertPaginator(
+        path="/fake",
+        mode=PaginationMode.OFFSET,
+        session=session,
+        item_type=_FakeItem,
+        deserialize=lambda items: [item.value for item in items],
+    )
+
+    with caplog.at_level("WARNING"):
+        results = list(paginator)
+
+    assert results == [1, 3]
+    assert any("A2" in record.message for record in caplog.records)
+
+
+def test_prefetch_matches_sequential_pagination() -> None:
+    """Test prefetching the next page yields the same items and requests."""
+    pages = [
+        _page(list(range(3)), last_key="k1"),
+        _page(list(range(3, 6)), last_key="k2"),
+        _page([6]),
+    ]
+    session = _ScriptedSession(pages)
+
+    paginator = AlbertPaginator(
+        path="/fake",
+        mode=PaginationMode.KEY,
+        session=session,
+        deserialize=lambda items: [item["id"] for item in items],
+        prefetch=True,
+    )
+
+    assert list(paginator) == list(range(7))
+    assert paginator.has_more is False
+    assert session.call_count == 3
+    assert paginator.params["startKey"] == "k2"
+
+
+def test_prefetch_skips_lookahead_when_page_reaches_max_items() -> None:
+    """Test no extra page is requested once the current page covers max_items."""
+    session = _ScriptedSession(
+        [
+            _page(list(range(3)), last_key="k1"),
+            _page(list(range(3, 6)), last_key="k2"),
+        ]
+    )
+
+    paginator = AlbertPaginator(
+        path="/fake",
+        mode=PaginationMode.KEY,
+        session=session,
+        deserialize=lambda items: [item["id"] for item in items],
+        max_items=3,
+        prefetch=True,
+    )
+
+    assert list(paginator) == [0, 1, 2]
+    assert paginator.has_more is True
+    assert session.call_count == 1
+
+
+def test_prefetch_last_key_matches_sequential_after_mid_page_break() -> None:
+    """Test last_key only advances once a page is fully yielded, with or without prefetch."""
+
+    def last_keys(*, prefetch: bool) -> list[str | None]:
+        session = _ScriptedSession(
+            [
+                _page(list(range(3)), last_key="k1"),
+                _page(list(range(3, 6)), last_key="k2"),
+                _page([6]),
+            ]
+        )
+        paginator = AlbertPaginator(
+            path="/fake",
+            mode=PaginationMode.KEY,
+            session=session,
+            deserialize=lambda items: [item["id"] for item in items],
+            prefetch=prefetch,
+        )
+        keys = []
+        for item in paginator:
+            keys.append(paginator.last_key)
+            if item == 4:
+                break
+        return keys
+
+    assert last_keys(prefetch=True) == last_keys(prefetch=False)
+    assert last_keys(prefetch=True) == [None, None, None, "k1", "k1"]
@@ -0,0 +1,75 @@
+import json
+
+from albert.collections.lots import LotCollection
+from albert.core.shared.models.patch import PatchOperation
+from albert.resources.lots import Lot
+
+
+def _lot(**overrides) -> Lot:
+    data = {"albertId": "LOTA1", "parentId": "INVA1", "inventoryOnHand": 0.3}
+    return Lot(**{**data, **overrides})
+
+
+def test_inventory_on_hand_change_is_sent_as_delta():
+    """Test an inventory on hand change is patched as a 14-place delta."""
+    updated = _lot()
+    updated.inventory_on_hand = 0.5
+
+    payload = LotCollection(session=None)._generate_lots_patch_payload(
+        existing=_lot(), updated=updated
+    )
+
+    assert len(payload.data) == 1
+    datum = payload.data[0]
+    assert datum.attribute == "inventoryOnHand"
+    assert datum.operation == PatchOperation.UPDATE
+    assert datum.new_value == "0.20000000000000"
+    assert datum.old_value == "0.3"
+
+
+def test_inventory_on_hand_float_noise_is_a_no_op():
+    """Test a change below the API's delta precision produces no patch."""
+    updated = _lot()
+    updated.inventory_on_hand = 0.1 + 0.2
+
+    payload = LotCollection(session=None)._generate_lots_patch_payload(
+        existing=_lot(), updated=updated
+    )
+
+    assert payload.data == []
+
+
+class _Response:
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+class _RecordingSession:
+    """Serves the existing lot on GET and records PATCH bodies."""
+
+    def __init__(self, lot: Lot):
+        self._content = lot.model_dump_json(by_alias=True).encode()
+        self.patch_bodies: list[dict] = []
+
+    def get(self, url, **kwargs):
+        return _Response(self._content)
+
+    def patch(self, url, *, data):
+        self.patch_bodies.append(json.loads(data))
+
+
+def test_update_sends_only_set_patch_values():
+    """Test update omits unset old/new values from the serialized PATCH body."""
+    session = _RecordingSession(_lot())
+    updated = _lot()
+    updated.manufacturer_lot_number = "MLN-1"
+    updated.workflow_id = "WFL1"
+
+    LotCollection(session=session).update(lot=updated)
+
+    assert len(session.patch_bodies) == 1
+    data = sorted(session.patch_bodies[0]["data"], key=lambda datum: datum["attribute"])
+    assert data == [
+        {"operation": "add", "attribute": "manufacturerLotNumber", "newValue": "MLN-1"},
+        {"operation": "update", "attribute": "workflowId", "newValue": "WFL1"},
+    ]